@@ -4,339 +4,563 @@ Basic HTML scraper for IARC Atlas of Colposcopy
 Scrapes case data including images and diagnostic information
 """
 
-import requests
-from bs4 import BeautifulSoup
+import aiofiles
+import aiohttp
+import asyncio
+from selectolax.parser import HTMLParser
 import csv
+from dataclasses import dataclass, field
+import hashlib
+from itertools import islice
+import json
 import os
+from pathlib import Path
 from urllib.parse import urljoin
-import time
 import re
 
+# Matches case image filenames like AABB0.jpg, capturing the case ID
+_CASE_ID_RE = re.compile(r'([A-Z]+)\d+\.')
+
+
+@dataclass(slots=True)
+class CaseRecord:
+    """One scraped atlas case with its metadata and image list"""
+    case_number: str = ''
+    case_id: str | None = None
+    age: str = ''
+    hpv_status: str = ''
+    provisional_diagnosis: str = ''
+    histopathology_diagnosis: str = ''
+    management: str = ''
+    swede_score: str | None = None
+    detail_link: str | None = None
+    images: list = field(default_factory=list)
+
+
+def find_next_node(node, tag):
+    """Find the first matching tag after a node in document order
+    (descendants first), like BeautifulSoup's find_next"""
+    current = node
+    while current is not None:
+        if current.child is not None:
+            current = current.child
+        else:
+            while current is not None and current.next is None:
+                current = current.parent
+            if current is None:
+                return None
+            current = current.next
+        if current is not None and current.tag == tag:
+            return current
+    return None
+
 
 class ColposcopyScraper:
-    def __init__(self, base_url="https://screening.iarc.fr"):
+    # Transient statuses and exceptions worth retrying with backoff
+    RETRY_STATUSES = {429, 502, 503, 504}
+    RETRY_EXCEPTIONS = (aiohttp.ClientConnectionError,
+                        aiohttp.ClientPayloadError,
+                        asyncio.TimeoutError)
+
+    def __init__(self, base_url="https://screening.iarc.fr", concurrency=8,
+                 cache_dir='.iarc_cache'):
         self.base_url = base_url
-        self.session = requests.Session()
-        self.session.headers.update({
+        self.concurrency = concurrency
+        self.cache_dir = cache_dir
+        self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        })
-    
+        }
+
+    def _cache_paths(self, url):
+        key = hashlib.sha1(url.encode('utf-8')).hexdigest()
+        return (os.path.join(self.cache_dir, key + '.body'),
+                os.path.join(self.cache_dir, key + '.meta'))
+
+    def _read_cache(self, url):
+        """Return (cached body, validators) for a URL, or (None, {})"""
+        if not self.cache_dir:
+            return None, {}
+        body_path, meta_path = self._cache_paths(url)
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+            with open(body_path, 'rb') as f:
+                return f.read(), meta
+        except (OSError, ValueError):
+            return None, {}
+
+    def _write_cache(self, url, body, headers):
+        """Store a response body plus its ETag/Last-Modified validators"""
+        if not self.cache_dir:
+            return
+        validators = {}
+        if headers.get('ETag'):
+            validators['etag'] = headers['ETag']
+        if headers.get('Last-Modified'):
+            validators['last_modified'] = headers['Last-Modified']
+        if not validators:
+            # Nothing to revalidate against on the next run
+            return
+        os.makedirs(self.cache_dir, exist_ok=True)
+        body_path, meta_path = self._cache_paths(url)
+        with open(body_path, 'wb') as f:
+            f.write(body)
+        with open(meta_path, 'w', encoding='utf-8') as f:
+            json.dump(validators, f)
+
+    def _make_session(self):
+        """Create an aiohttp session with pooled keep-alive connections
+        and a per-host cap for politeness"""
+        return aiohttp.ClientSession(
+            headers=self.headers,
+            connector=aiohttp.TCPConnector(
+                limit=32,
+                limit_per_host=4,
+                keepalive_timeout=30
+            ),
+            timeout=aiohttp.ClientTimeout(total=30)
+        )
+
+    async def fetch(self, session, url, retries=3):
+        """Fetch a URL and return the response body as bytes,
+        retrying transient failures with exponential backoff.
+
+        Responses carrying ETag/Last-Modified validators are cached on
+        disk, so re-runs revalidate with a conditional GET and reuse the
+        cached body on 304 Not Modified."""
+        cached_body, validators = self._read_cache(url)
+        headers = {}
+        if cached_body is not None:
+            if validators.get('etag'):
+                headers['If-None-Match'] = validators['etag']
+            if validators.get('last_modified'):
+                headers['If-Modified-Since'] = validators['last_modified']
+
+        for attempt in range(retries + 1):
+            try:
+                async with session.get(url, headers=headers) as response:
+                    if response.status == 304:
+                        return cached_body
+                    if response.status in self.RETRY_STATUSES and attempt < retries:
+                        await asyncio.sleep(0.5 * 2 ** attempt)
+                        continue
+                    response.raise_for_status()
+                    body = await response.read()
+                    self._write_cache(url, body, response.headers)
+                    return body
+            except self.RETRY_EXCEPTIONS:
+                if attempt == retries:
+                    raise
+                await asyncio.sleep(0.5 * 2 ** attempt)
+
+    async def fetch_to_file(self, session, url, filename, retries=3):
+        """Fetch a URL and stream the response body to a file in 64KB
+        chunks, so large images never sit fully in memory.
+
+        The body is streamed to a .part file and renamed onto the
+        destination only once complete, so a failed or cancelled
+        download never leaves partial bytes at the final path"""
+        part = filename.with_suffix(filename.suffix + '.part')
+        try:
+            for attempt in range(retries + 1):
+                try:
+                    async with session.get(url) as response:
+                        if response.status in self.RETRY_STATUSES and attempt < retries:
+                            await asyncio.sleep(0.5 * 2 ** attempt)
+                            continue
+                        response.raise_for_status()
+                        async with aiofiles.open(part, 'wb') as f:
+                            async for chunk in response.content.iter_chunked(65536):
+                                await f.write(chunk)
+                        os.replace(part, filename)
+                        return
+                except self.RETRY_EXCEPTIONS:
+                    if attempt == retries:
+                        raise
+                    await asyncio.sleep(0.5 * 2 ** attempt)
+        finally:
+            if part.exists():
+                part.unlink()
+
+    def _absolutize(self, href):
+        """Resolve an href against the base URL, skipping the full
+        urljoin parse when the link is already absolute"""
+        if href.startswith(('http://', 'https://')):
+            return href
+        return urljoin(self.base_url, href)
+
     def extract_case_id_from_image(self, img_src):
         """Extract case ID from image filename (e.g., AABB0.jpg -> AABB)"""
         if img_src:
             filename = os.path.basename(img_src)
             # Remove extension and trailing number
-            match = re.match(r'([A-Z]+)\d+\.', filename)
+            match = _CASE_ID_RE.match(filename)
             if match:
                 return match.group(1)
         return None
-    
-    def scrape_list_page(self, url):
+
+    def parse_list_page(self, html):
         """
-        Scrape the colposcopy atlas list page to get case IDs and basic info
-        
+        Parse the colposcopy atlas list page to get case IDs and basic info
+
         Args:
-            url: Full URL to scrape
-            
+            html: Raw HTML bytes of the list page
+
         Returns:
-            List of dictionaries containing case data with detail links
+            List of CaseRecord objects with detail links
         """
-        print(f"Fetching list page: {url}")
-        
-        try:
-            response = self.session.get(url, timeout=30)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # Find all table rows
-            cases = []
-            
-            table = soup.find('div', class_='col-sm-11')
-            if table:
-                table = table.find('table', class_='table table-striped table-hover')
-            
-            if not table:
-                print("No table found on page")
-                return cases
-            
-            rows = table.find_all('tr')[1:]  # Skip header row
-            
-            for row in rows:
-                cols = row.find_all('td')
-                
-                if len(cols) >= 5:
-                    # Extract case number from table
-                    case_number = cols[0].get_text(strip=True)
-                    
-                    # Extract diagnosis from last column
-                    diagnosis_col = cols[4]
-                    diagnosis_font = diagnosis_col.find('font')
-                    histopathology_diagnosis = diagnosis_font.get_text(strip=True) if diagnosis_font else cols[4].get_text(strip=True)
-                    
-                    # Extract thumbnail image to get case ID
-                    img_tag = cols[1].find('img')
-                    case_id = None
-                    if img_tag and img_tag.get('src'):
-                        case_id = self.extract_case_id_from_image(img_tag.get('src'))
-                    
-                    # Extract detail link - clicking on image leads to detail page
-                    detail_link = None
-                    link_tag = cols[1].find('a')
-                    if link_tag and link_tag.get('href'):
-                        detail_link = urljoin(self.base_url, link_tag.get('href'))
-                    
-                    case_data = {
-                        'case_number': case_number,
-                        'case_id': case_id,
-                        'histopathology_diagnosis': histopathology_diagnosis,
-                        'detail_link': detail_link
-                    }
-                    
-                    cases.append(case_data)
-                    print(f"Found Case {case_number} (ID: {case_id})")
-            
-            print(f"Total cases found on list page: {len(cases)}")
+        # selectolax keeps all tree traversal in C, avoiding BS4's
+        # Python-level node objects entirely
+        tree = HTMLParser(html)
+
+        # Find all table rows
+        cases = []
+
+        rows = tree.css('div.col-sm-11 table.table-striped.table-hover tr')
+
+        if not rows:
+            print("No table found on page")
             return cases
-            
-        except requests.RequestException as e:
-            print(f"Error fetching page: {e}")
-            return []
-    
-    def scrape_detail_page(self, detail_url, case_data):
+
+        for row in islice(rows, 1, None):  # Skip header row
+            cols = row.css('td')
+
+            if len(cols) >= 5:
+                # Extract case number from table
+                case_number = cols[0].text(strip=True)
+
+                # Extract diagnosis from last column
+                diagnosis_col = cols[4]
+                diagnosis_font = diagnosis_col.css_first('font')
+                histopathology_diagnosis = diagnosis_font.text(strip=True) if diagnosis_font is not None else cols[4].text(strip=True)
+
+                # Extract thumbnail image to get case ID
+                img_tag = cols[1].css_first('img')
+                case_id = None
+                src = img_tag.attributes.get('src') if img_tag is not None else None
+                if src:
+                    case_id = self.extract_case_id_from_image(src)
+
+                # Extract detail link - clicking on image leads to detail page
+                detail_link = None
+                link_tag = cols[1].css_first('a')
+                href = link_tag.attributes.get('href') if link_tag is not None else None
+                if href:
+                    detail_link = self._absolutize(href)
+
+                cases.append(CaseRecord(
+                    case_number=case_number,
+                    case_id=case_id,
+                    histopathology_diagnosis=histopathology_diagnosis,
+                    detail_link=detail_link
+                ))
+                print(f"Found Case {case_number} (ID: {case_id})")
+
+        print(f"Total cases found on list page: {len(cases)}")
+        return cases
+
+    def parse_detail_page(self, html, case_data):
         """
-        Scrape the detail page for a specific case to get all images and metadata
-        
+        Parse the detail page for a specific case to get all images and metadata
+
         Args:
-            detail_url: URL to the case detail page
-            case_data: Dictionary with basic case info from list page
-            
+            html: Raw HTML bytes of the detail page
+            case_data: CaseRecord with basic case info from list page
+
         Returns:
-            Updated case_data dictionary with complete information
+            Updated CaseRecord with complete information
         """
-        print(f"  Fetching detail page: {detail_url}")
-        
-        try:
-            response = self.session.get(detail_url, timeout=30)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # Find the main content div
-            content_div = soup.find('div', class_='col-sm-11')
-            
-            if not content_div:
-                print(f"  Warning: Could not find content div for case {case_data['case_number']}")
-                return case_data
-            
-            # Extract age and HPV status
-            age_and_hpv = content_div.find_all('font')
-            age_li = age_and_hpv[1]
-            if age_li:
-                age_b = age_li.find_next('b')
-                case_data['age'] = age_b.get_text(strip=True) if age_b else 'Unknown'
-
-            hpv_li = age_and_hpv[2]
-            if hpv_li:
-                hpv_b = hpv_li.find_next('b')
-                case_data['hpv_status'] = hpv_b.get_text(strip=True) if hpv_b else 'Unknown'
-                
-            # Extract all images from the detail page
-            images = []
-            thumbnails = content_div.find_all('div', class_='col-md-13 thumbnail')
-            
-            for idx, thumbnail in enumerate(thumbnails):
-                # Find the fancybox link that contains the full image
-                fancybox = thumbnail.find('a', class_='fancybox')
-                if fancybox and fancybox.get('href'):
-                    img_url = urljoin(self.base_url, fancybox.get('href'))
-                    img_title = fancybox.get('title', '')
-                    
-                    # Find the image stage/description (After normal saline, After acetic acid, etc.)
-                    stage_font = thumbnail.find_next('font')
-                    stage = 'Unknown'
-                    if stage_font:
-                        stage_b = stage_font.find('b')
-                        if stage_b:
-                            stage = stage_b.get_text(strip=True)
-                    
-                    images.append({
-                        'url': img_url,
-                        'stage': stage,
-                        'description': img_title,
-                        'order': idx + 1
-                    })
-            
-            case_data['images'] = images
-            print(f"  Found {len(images)} images for case {case_data['case_number']}")
-            
-            # Extract provisional diagnosis from case summary
-            prov_diag = content_div.find('font', string=re.compile(r'Provisional diagnosis:'))
-            if prov_diag:
-                prov_td = prov_diag.find_next('td')
-                if prov_td:
-                    prov_b = prov_td.find('b')
-                    case_data['provisional_diagnosis'] = prov_b.get_text(strip=True) if prov_b else prov_td.get_text(strip=True)
-            
-            # Extract management
-            management = content_div.find('font', string=re.compile(r'Management:'))
-            if management:
-                mgmt_td = management.find_next('td')
-                if mgmt_td:
-                    mgmt_b = mgmt_td.find('b')
-                    case_data['management'] = mgmt_b.get_text(strip=True) if mgmt_b else mgmt_td.get_text(strip=True)
-            
-            # Extract Swede score
-            score_tags = content_div.find_all("font")
-            for tag in score_tags:
-                if "Swede score:" in tag.text:
-                    score_tag = [tag]
-            if score_tag:
-                next_font = score_tag[0].find_next("font", color="#FFAB19")
-                score = next_font.text.strip() if next_font else None
-            else:
-                score = None
-            case_data['swede_score'] = score
+        tree = HTMLParser(html)
 
+        # Find the main content div
+        content_div = tree.css_first('div.col-sm-11')
+
+        if content_div is None:
+            print(f"  Warning: Could not find content div for case {case_data.case_number}")
             return case_data
-            
-        except requests.RequestException as e:
-            print(f"  Error fetching detail page: {e}")
-            return case_data
-    
+
+        # Collect the font tags once; every labelled field below comes out
+        # of this list instead of re-walking the subtree per query
+        fonts = content_div.css('font')
+
+        # Extract age and HPV status
+        age_li = fonts[1]
+        if age_li is not None:
+            age_b = find_next_node(age_li, 'b')
+            case_data.age = age_b.text(strip=True) if age_b is not None else 'Unknown'
+
+        hpv_li = fonts[2]
+        if hpv_li is not None:
+            hpv_b = find_next_node(hpv_li, 'b')
+            case_data.hpv_status = hpv_b.text(strip=True) if hpv_b is not None else 'Unknown'
+
+        # Locate the labelled summary fields in a single pass
+        prov_diag = management = score_tag = None
+        for font in fonts:
+            text = font.text()
+            if prov_diag is None and 'Provisional diagnosis:' in text:
+                prov_diag = font
+            elif management is None and 'Management:' in text:
+                management = font
+            elif score_tag is None and 'Swede score:' in text:
+                score_tag = font
+
+        # Extract all images from the detail page
+        images = []
+        thumbnails = content_div.css('div.col-md-13.thumbnail')
+
+        for idx, thumbnail in enumerate(thumbnails):
+            # Find the fancybox link that contains the full image
+            fancybox = thumbnail.css_first('a.fancybox')
+            attrs = fancybox.attributes if fancybox is not None else {}
+            if attrs.get('href'):
+                img_url = self._absolutize(attrs['href'])
+                img_title = attrs.get('title') or ''
+
+                # Find the image stage/description (After normal saline, After acetic acid, etc.)
+                stage_font = find_next_node(thumbnail, 'font')
+                stage = 'Unknown'
+                if stage_font is not None:
+                    stage_b = stage_font.css_first('b')
+                    if stage_b is not None:
+                        stage = stage_b.text(strip=True)
+
+                images.append({
+                    'url': img_url,
+                    'stage': stage,
+                    'description': img_title,
+                    'order': idx + 1
+                })
+
+        case_data.images = images
+        print(f"  Found {len(images)} images for case {case_data.case_number}")
+
+        # Extract provisional diagnosis from case summary
+        if prov_diag is not None:
+            prov_td = find_next_node(prov_diag, 'td')
+            if prov_td is not None:
+                prov_b = prov_td.css_first('b')
+                case_data.provisional_diagnosis = prov_b.text(strip=True) if prov_b is not None else prov_td.text(strip=True)
+
+        # Extract management
+        if management is not None:
+            mgmt_td = find_next_node(management, 'td')
+            if mgmt_td is not None:
+                mgmt_b = mgmt_td.css_first('b')
+                case_data.management = mgmt_b.text(strip=True) if mgmt_b is not None else mgmt_td.text(strip=True)
+
+        # Extract Swede score: the value is the first coloured font tag
+        # after the label, so walk the already-selected font list instead
+        # of re-traversing every node in the document
+        if score_tag is not None:
+            score_idx = fonts.index(score_tag)
+            next_font = next((f for f in fonts[score_idx + 1:]
+                              if f.attributes.get('color') == '#FFAB19'), None)
+            score = next_font.text(strip=True) if next_font is not None else None
+        else:
+            score = None
+        case_data.swede_score = score
+
+        return case_data
+
+    async def _scrape_case(self, session, semaphore, idx, total, case):
+        """Fetch and parse one detail page, bounded by the shared semaphore"""
+        async with semaphore:
+            print(f"\nProcessing case {idx}/{total}: {case.case_number}")
+
+            if case.detail_link:
+                print(f"  Fetching detail page: {case.detail_link}")
+                try:
+                    html = await self.fetch(session, case.detail_link)
+                except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                    print(f"  Error fetching detail page: {e}")
+                    return case
+
+                # selectolax has no incremental-feed API, so parsing waits
+                # for the full body; network/parse overlap comes from the
+                # other tasks progressing while this one parses
+                case = self.parse_detail_page(html, case)
+
+                # Be polite - small delay per request
+                await asyncio.sleep(0.2)
+            else:
+                print(f"  Warning: No detail link for case {case.case_number}")
+
+            return case
+
+    async def _scrape_all(self, list_url):
+        async with self._make_session() as session:
+            print(f"Fetching list page: {list_url}")
+            try:
+                html = await self.fetch(session, list_url)
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                print(f"Error fetching page: {e}")
+                return []
+
+            cases = self.parse_list_page(html)
+
+            semaphore = asyncio.Semaphore(self.concurrency)
+            return list(await asyncio.gather(
+                *[self._scrape_case(session, semaphore, idx, len(cases), case)
+                  for idx, case in enumerate(cases, 1)]
+            ))
+
     def scrape_all_cases(self, list_url):
         """
-        Scrape all cases from list page and their detail pages
-        
+        Scrape all cases from list page and their detail pages concurrently
+
         Args:
             list_url: URL to the list page
-            
+
         Returns:
-            List of complete case data dictionaries
+            List of complete CaseRecord objects
         """
-        # First, get all cases from the list page
-        cases = self.scrape_list_page(list_url)
-        
-        # Then, scrape each detail page
-        complete_cases = []
-        for idx, case in enumerate(cases, 1):
-            print(f"\nProcessing case {idx}/{len(cases)}: {case['case_number']}")
-            
-            if case.get('detail_link'):
-                complete_case = self.scrape_detail_page(case['detail_link'], case)
-                complete_cases.append(complete_case)
-                
-                # Be polite - wait between requests
-                time.sleep(1)
-            else:
-                print(f"  Warning: No detail link for case {case['case_number']}")
-                complete_cases.append(case)
-        
-        return complete_cases
-    
+        return asyncio.run(self._scrape_all(list_url))
+
     def save_to_csv(self, cases, filename='colposcopy_cases.csv'):
         """
         Save scraped data to CSV file
-        
+
         Args:
-            cases: List of case dictionaries
+            cases: List of CaseRecord objects
             filename: Output CSV filename
         """
         if not cases:
             print("No cases to save")
             return
-        
+
         with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
-            fieldnames = ['case_number', 'case_id', 'age', 'hpv_status', 
-                         'provisional_diagnosis', 'histopathology_diagnosis', 
-                         'management', 'swede_score', 'num_images', 
+            fieldnames = ['case_number', 'case_id', 'age', 'hpv_status',
+                         'provisional_diagnosis', 'histopathology_diagnosis',
+                         'management', 'swede_score', 'num_images',
                          'detail_link']
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            
-            writer.writeheader()
-            for case in cases:
-                # Create a simplified row for CSV
-                row = {
-                    'case_number': case.get('case_number', ''),
-                    'case_id': case.get('case_id', ''),
-                    'age': case.get('age', ''),
-                    'hpv_status': case.get('hpv_status', ''),
-                    'provisional_diagnosis': case.get('provisional_diagnosis', ''),
-                    'histopathology_diagnosis': case.get('histopathology_diagnosis', ''),
-                    'management': case.get('management', ''),
-                    'swede_score': case.get('swede_score', ''),
-                    'num_images': len(case.get('images', [])),
-                    'detail_link': case.get('detail_link', '')
-                }
-                writer.writerow(row)
-        
+            writer = csv.writer(csvfile)
+
+            writer.writerow(fieldnames)
+            # Build simplified rows for CSV and write them in one pass
+            writer.writerows(
+                (case.case_number,
+                 case.case_id,
+                 case.age,
+                 case.hpv_status,
+                 case.provisional_diagnosis,
+                 case.histopathology_diagnosis,
+                 case.management,
+                 case.swede_score,
+                 len(case.images),
+                 case.detail_link)
+                for case in cases)
+
         print(f"\nData saved to {filename}")
-    
-    def download_images(self, cases, output_dir='images'):
-        """
-        Download images from scraped cases
-        
-        Args:
-            cases: List of case dictionaries
-            output_dir: Directory to save images
-        """
-        if not os.path.exists(output_dir):
-            os.makedirs(output_dir)
-        
-        total_images = sum(len(case.get('images', [])) for case in cases)
-        downloaded = 0
-        
+
+    async def _download_image(self, session, semaphore, case_id, img_data, filename):
+        """Download a single image, bounded by the shared semaphore"""
+        img_url = img_data['url']
+        stage = img_data['stage']
+
+        async with semaphore:
+            try:
+                # Skip files already downloaded on a previous run; files
+                # only reach this path once fetch_to_file has streamed the
+                # complete body, so existing means complete
+                if filename.exists():
+                    print(f"  Skipping {case_id} - {stage} (already downloaded)")
+                    return True
+
+                print(f"  Downloading {case_id} - {stage}...")
+                await self.fetch_to_file(session, img_url, filename)
+
+                # Be polite, don't hammer the server
+                await asyncio.sleep(0.2)
+                return True
+
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                print(f"  Error downloading {img_url}: {e}")
+                return False
+
+    async def _download_all(self, cases, output_dir, concurrency):
+        output_dir = Path(output_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
+
+        total_images = sum(len(case.images) for case in cases)
+
         print(f"\nStarting download of {total_images} images from {len(cases)} cases...")
-        
+
+        tasks = []
+        seen = {}
+        duplicates = []
         for case in cases:
-            case_num = case.get('case_number', 'unknown')
-            case_id = case.get('case_id', case_num)
-            case_dir = os.path.join(output_dir, f"case_{case_id}")
-            
-            if not os.path.exists(case_dir):
-                os.makedirs(case_dir)
-            
-            # Save case metadata
-            metadata_file = os.path.join(case_dir, 'metadata.txt')
-            with open(metadata_file, 'w', encoding='utf-8') as f:
-                f.write(f"Case Number: {case.get('case_number', '')}\n")
-                f.write(f"Case ID: {case.get('case_id', '')}\n")
-                f.write(f"Age: {case.get('age', '')}\n")
-                f.write(f"HPV Status: {case.get('hpv_status', '')}\n")
-                f.write(f"Provisional Diagnosis: {case.get('provisional_diagnosis', '')}\n")
-                f.write(f"Histopathology Diagnosis: {case.get('histopathology_diagnosis', '')}\n")
-                f.write(f"Management: {case.get('management', '')}\n")
-                f.write(f"Swede Score: {case.get('swede_score', '')}\n")
-                f.write(f"Detail Link: {case.get('detail_link', '')}\n\n")
-                f.write("Images:\n")
-                for img in case.get('images', []):
-                    f.write(f"  {img['order']}. {img['stage']}: {img['url']}\n")
-            
-            for img_data in case.get('images', []):
+            case_num = case.case_number or 'unknown'
+            case_id = case.case_id or case_num
+            case_dir = output_dir / f"case_{case_id}"
+            case_dir.mkdir(exist_ok=True)
+
+            # Save case metadata in one write
+            metadata_file = case_dir / 'metadata.txt'
+            metadata = (
+                f"Case Number: {case.case_number}\n"
+                f"Case ID: {case.case_id}\n"
+                f"Age: {case.age}\n"
+                f"HPV Status: {case.hpv_status}\n"
+                f"Provisional Diagnosis: {case.provisional_diagnosis}\n"
+                f"Histopathology Diagnosis: {case.histopathology_diagnosis}\n"
+                f"Management: {case.management}\n"
+                f"Swede Score: {case.swede_score}\n"
+                f"Detail Link: {case.detail_link}\n\n"
+                "Images:\n"
+                + ''.join(f"  {img['order']}. {img['stage']}: {img['url']}\n"
+                          for img in case.images)
+            )
+            metadata_file.write_text(metadata, encoding='utf-8')
+
+            for img_data in case.images:
                 img_url = img_data['url']
                 stage = img_data['stage'].replace(' ', '_').replace('/', '_')
-                order = img_data['order']
-                
-                try:
-                    print(f"  [{downloaded+1}/{total_images}] Downloading {case_id} - {stage}...")
-                    response = self.session.get(img_url, timeout=30)
-                    response.raise_for_status()
-                    
-                    # Get file extension from URL
-                    ext = os.path.splitext(img_url)[1] or '.jpg'
-                    filename = os.path.join(case_dir, f"{order}_{stage}{ext}")
-                    
-                    with open(filename, 'wb') as f:
-                        f.write(response.content)
-                    
-                    downloaded += 1
-                    time.sleep(0.5)  # Be polite, don't hammer the server
-                    
-                except requests.RequestException as e:
-                    print(f"  Error downloading {img_url}: {e}")
-        
+
+                # Get file extension from URL
+                ext = os.path.splitext(img_url)[1] or '.jpg'
+                filename = case_dir / f"{img_data['order']}_{stage}{ext}"
+
+                # Download each distinct URL once; extra occurrences are
+                # hard-linked to the first copy once its download succeeds
+                if img_url in seen:
+                    duplicates.append((seen[img_url], filename))
+                    continue
+                seen[img_url] = len(tasks)
+                tasks.append((case_id, img_data, filename))
+
+        semaphore = asyncio.Semaphore(concurrency)
+        async with self._make_session() as session:
+            results = await asyncio.gather(
+                *[self._download_image(session, semaphore, case_id, img_data, filename)
+                  for case_id, img_data, filename in tasks]
+            )
+
+        downloaded = sum(results)
+        # Link duplicates only when their source task actually succeeded,
+        # so a failed download is never multiplied into "successful" copies
+        for src_idx, dest in duplicates:
+            if dest.exists():
+                downloaded += 1
+            elif results[src_idx]:
+                os.link(tasks[src_idx][2], dest)
+                downloaded += 1
+
         print(f"\nDownload complete! {downloaded}/{total_images} images downloaded successfully.")
 
+    def download_images(self, cases, output_dir='images', concurrency=None):
+        """
+        Download images from scraped cases concurrently
+
+        Args:
+            cases: List of CaseRecord objects
+            output_dir: Directory to save images
+            concurrency: Number of downloads in flight (defaults to the
+                scraper-wide setting)
+        """
+        asyncio.run(self._download_all(cases, output_dir,
+                                       concurrency or self.concurrency))
+
 
 def main():
     # URL to scrape
@@ -344,17 +568,17 @@ def main():
     url = "https://screening.iarc.fr/atlascolpodiag_list.php?FinalDiag=31&e=,0,1,2,3,8,10,15,19,30,31,43,46,47,60,61,68,73,83,88,89,93,96,102,105,111#0"
     # Create scraper instance
     scraper = ColposcopyScraper()
-    
+
     # Scrape all cases (list page + detail pages)
     print("=" * 70)
     print("IARC Atlas of Colposcopy Scraper")
     print("=" * 70)
     cases = scraper.scrape_all_cases(url)
-    
+
     # Save to CSV
     if cases:
         scraper.save_to_csv(cases)
-        
+
         # Optional: Download images
         print("\n" + "=" * 70)
         download_choice = input("Do you want to download all images? (y/n): ").lower()